@@ -1,7 +1,7 @@
 bl_info = {
     "name": "Simple COLLADA (.dae) Importer (Positions + Normals + Colors + UVs + Textures + Rig)",
-    "author": "ekztal"
-    "additional help": "MilesExilium"
+    "author": "ekztal",
+    "additional help": "MilesExilium",
     "version": (0, 7, 2),
     "blender": (5, 0, 0),
     "location": "File > Import > Simple COLLADA (.dae)",
@@ -10,13 +10,22 @@ bl_info = {
 }
 
 import os
+import sys
 import math
+import warnings
+from types import SimpleNamespace
+import numpy as np
 import bpy
 from bpy_extras.io_utils import ImportHelper
 from bpy.types import Operator
 from bpy.props import StringProperty, BoolProperty
 from mathutils import Vector, Matrix
-import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as ET   # libxml2-backed parser, much faster on big files
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 
 
 # ---------------------- XML/NAMESPACE HELPERS ----------------------
@@ -33,28 +42,182 @@ def q(ns, tag):
     return f"{ns}{tag}"
 
 
-def parse_source_float_array(source_elem, ns):
+def parse_number_text(text, dtype):
+    """
+    Parse whitespace-separated numbers with np.fromstring.
+    Returns an empty array for blank text, and None if any token is malformed:
+    fromstring would otherwise return the prefix it managed to read (and may
+    parse the start of a bad token) with only a DeprecationWarning.
+    """
+    if text is None or not text.strip():
+        return np.empty(0, dtype=dtype)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=dtype, sep=" ")
+        except (ValueError, DeprecationWarning):
+            return None
+
+
+def collada_tags(ns):
+    """
+    Precompute the namespaced tags used in the geometry/material hot paths,
+    so find()/findall() loops don't rebuild the same strings per element.
+    """
+    names = ("source", "input", "p", "vcount", "float_array", "accessor",
+             "technique_common", "triangles", "polylist", "mesh", "geometry",
+             "vertices", "image", "effect", "material", "init_from",
+             "instance_effect", "newparam", "surface", "sampler2D",
+             "profile_COMMON", "technique", "texture", "float", "color")
+    T = SimpleNamespace(ns=ns, **{name: q(ns, name) for name in names})
+    T.accessor_path = f"{T.technique_common}/{T.accessor}"
+    return T
+
+
+def collect_elements(root, T):
+    """
+    Gather the elements later passes need by walking only the libraries they
+    live in (library_images/image, library_effects/effect, ...), so big
+    subtrees like geometry data, animations and visual scenes aren't descended.
+    Returns SimpleNamespace(images, effects, materials, geometries) of lists.
+    """
+    found = SimpleNamespace(images=[], effects=[], materials=[], geometries=[])
+    libraries = {
+        q(T.ns, "library_images"):     (T.image,    found.images),
+        q(T.ns, "library_effects"):    (T.effect,   found.effects),
+        q(T.ns, "library_materials"):  (T.material, found.materials),
+        q(T.ns, "library_geometries"): (T.geometry, found.geometries),
+    }
+    for lib in root:
+        entry = libraries.get(lib.tag)
+        if entry is not None:
+            tag, bucket = entry
+            bucket.extend(lib.findall(tag))
+    # COLLADA 1.4 also allows <image> declared inside an effect's profile
+    for eff in found.effects:
+        found.images.extend(eff.iter(T.image))
+    return found
+
+
+def parse_dae(filepath):
+    """
+    Parse a DAE file into a full element tree and return its root.
+    Uses lxml when available, stdlib ElementTree otherwise.
+    """
+    if HAS_LXML:
+        # huge_tree lifts libxml2's 10 MB text-node cap, which big <float_array>s exceed
+        parser = ET.XMLParser(huge_tree=True, remove_comments=True, remove_pis=True)
+        return ET.parse(filepath, parser).getroot()
+    return ET.parse(filepath).getroot()
+
+
+def release_element(elem):
+    """
+    Free an already-processed element (e.g. a <geometry> or <effect>) so its
+    large float/index arrays don't stay resident for the rest of the import.
+    With lxml, earlier (already released) siblings are dropped from the parent too.
+    """
+    elem.clear()
+    if HAS_LXML:
+        parent = elem.getparent()
+        while parent is not None and elem.getprevious() is not None:
+            del parent[0]
+
+
+def parse_source_float_array(source_elem, T):
     """
     Parse <source><float_array>...</float_array></source>
     Handles stride from <accessor>.
-    Returns list of tuples (length = stride).
+    Returns float32 ndarray of shape (N, stride); empty (0, stride) if missing.
     """
-    float_array = source_elem.find(q(ns, "float_array"))
-    if float_array is None or float_array.text is None:
-        return []
-    raw_vals = float_array.text.strip().split()
-    try:
-        floats = [float(v) for v in raw_vals]
-    except ValueError:
-        return []
-    accessor = source_elem.find(f"{q(ns,'technique_common')}/{q(ns,'accessor')}")
+    accessor = source_elem.find(T.accessor_path)
     stride = int(accessor.attrib.get("stride", "3")) if accessor is not None else 3
-    out = []
-    for i in range(0, len(floats), stride):
-        chunk = floats[i:i+stride]
-        if len(chunk) < stride:
-            break
-        out.append(tuple(chunk))
+    float_array = source_elem.find(T.float_array)
+    if float_array is None or float_array.text is None or stride <= 0:
+        return np.empty((0, max(stride, 1)), dtype=np.float32)
+    arr = parse_number_text(float_array.text, np.float32)
+    if arr is None:
+        return np.empty((0, stride), dtype=np.float32)
+    return arr[:(arr.size // stride) * stride].reshape(-1, stride)
+
+
+def fan_triangulate(vcounts):
+    """
+    Fan-triangulate polygons from their first corner: (0,1,2), (0,2,3), (0,3,4) ...
+    vcounts: per-polygon corner counts.
+    Returns int ndarray (tris, 3) of indices into the flat corner stream.
+    """
+    vcounts = np.asarray(vcounts, dtype=np.int64)
+    if vcounts.size and np.all(vcounts == 3):
+        return np.arange(vcounts.size * 3).reshape(-1, 3)
+    starts = np.cumsum(vcounts) - vcounts
+    ntris  = np.maximum(vcounts - 2, 0)
+    first  = np.repeat(starts, ntris)
+    local  = np.arange(ntris.sum()) - np.repeat(np.cumsum(ntris) - ntris, ntris)
+    return np.stack([first, first + local + 1, first + local + 2], axis=1)
+
+
+# Optional Numba kernel for split_tri_indices. numba is imported (and the kernel
+# JIT-compiled) only on the first mesh big enough to benefit, so a normal session
+# never pays for either; below this size the numpy gather is just as fast.
+NUMBA_MIN_TRIS = 1_000_000
+_prange        = range   # swapped for numba.prange before compiling
+_numba_kernel  = None
+_numba_tried   = False
+
+
+def _split_tri_indices_kernel(raw_idx, tri_corners, num_inputs, offsets):
+    out = np.zeros((tri_corners.shape[0], 3, offsets.size), dtype=np.int32)
+    for t in _prange(tri_corners.shape[0]):
+        for c in range(3):
+            base = tri_corners[t, c] * num_inputs
+            for k in range(offsets.size):
+                if offsets[k] >= 0:
+                    out[t, c, k] = raw_idx[base + offsets[k]]
+    return out
+
+
+def _get_numba_kernel():
+    """Import numba and compile the kernel once; None if numba isn't installed."""
+    global _prange, _numba_kernel, _numba_tried
+    if not _numba_tried:
+        _numba_tried = True
+        try:
+            import numba
+        except ImportError:
+            return None
+        _prange       = numba.prange
+        _numba_kernel = numba.njit(cache=True, parallel=True)(_split_tri_indices_kernel)
+    return _numba_kernel
+
+
+def split_tri_indices(raw_idx, tri_corners, num_inputs, offsets):
+    """
+    Gather the per-corner indices of each triangle for the requested inputs.
+    offsets: int array of input offsets, -1 for inputs the block doesn't have.
+    Returns int32 ndarray (tris, 3, len(offsets)); missing inputs read as 0.
+    Meshes of NUMBA_MIN_TRIS or more use a fused Numba kernel when numba is
+    installed; everything else uses numpy fancy indexing.
+    """
+    if len(tri_corners) >= NUMBA_MIN_TRIS:
+        kernel = _get_numba_kernel()
+        if kernel is not None:
+            return kernel(raw_idx, tri_corners, num_inputs, offsets)
+    corner_idx = raw_idx[:(raw_idx.size // num_inputs) * num_inputs].reshape(-1, num_inputs)
+    out = corner_idx[tri_corners][..., np.maximum(offsets, 0)]
+    out[..., offsets < 0] = 0
+    return out
+
+
+def gather_rows(source, idx, default):
+    """
+    Gather rows of a (N, stride) source for every index in idx.
+    Out-of-range indices get the default row instead.
+    """
+    invalid = (idx < 0) | (idx >= len(source))
+    out     = source[np.clip(idx, 0, len(source) - 1)]
+    if invalid.any():
+        out[invalid] = default
     return out
 
 
@@ -87,26 +250,27 @@ def get_up_axis_matrix(root, ns):
 
 # ---------------------- MATERIAL / TEXTURE HELPERS ----------------------
 
-def extract_material_texture_map(root, ns):
+def extract_material_texture_map(elements, T):
     """
     Returns dict: material_id -> {"diffuse": path, "normal": path, "ao": path, "specular": path}
-    Reads library_images -> library_effects (sampler/surface chain) -> library_materials.
+    Reads library_images -> library_effects (sampler/surface chain) -> library_materials,
+    using the element lists gathered by collect_elements().
     Handles both standard <diffuse> and FCOLLADA <extra><bump> for normal maps.
     """
 
     # 1. image_id -> file path
     image_path_for_id = {}
-    for img in root.findall(f".//{q(ns,'image')}"):
+    for img in elements.images:
         img_id = img.attrib.get("id")
         if not img_id:
             continue
-        init_from = img.find(q(ns, "init_from"))
+        init_from = img.find(T.init_from)
         if init_from is not None and init_from.text:
             image_path_for_id[img_id] = init_from.text.strip()
 
     # 2. effect_id -> {channel: file_path}
     channels_for_effect = {}
-    for eff in root.findall(f".//{q(ns,'effect')}"):
+    for eff in elements.effects:
         eff_id = eff.attrib.get("id")
         if not eff_id:
             continue
@@ -115,16 +279,16 @@ def extract_material_texture_map(root, ns):
         # (must be built as a local dict, not a closure over a loop variable)
         sid_to_image   = {}   # surface sid  -> image_id
         sid_to_surface = {}   # sampler sid  -> surface sid
-        for newparam in eff.findall(f".//{q(ns,'newparam')}"):
+        for newparam in eff.findall(f".//{T.newparam}"):
             sid     = newparam.attrib.get("sid", "")
-            surface = newparam.find(q(ns, "surface"))
+            surface = newparam.find(T.surface)
             if surface is not None:
-                inf = surface.find(q(ns, "init_from"))
+                inf = surface.find(T.init_from)
                 if inf is not None and inf.text:
                     sid_to_image[sid] = inf.text.strip()
-            sampler = newparam.find(q(ns, "sampler2D"))
+            sampler = newparam.find(T.sampler2D)
             if sampler is not None:
-                src = sampler.find(q(ns, "source"))
+                src = sampler.find(T.source)
                 if src is not None and src.text:
                     sid_to_surface[sid] = src.text.strip()
 
@@ -143,17 +307,17 @@ def extract_material_texture_map(root, ns):
         spec_color  = None
 
         # --- Standard phong/lambert profile_COMMON technique ---
-        profile = eff.find(q(ns, "profile_COMMON"))
+        profile = eff.find(T.profile_COMMON)
         if profile is not None:
-            technique = profile.find(q(ns, "technique"))
+            technique = profile.find(T.technique)
             if technique is not None:
                 for shader in technique:
-                    shader_tag = shader.tag.replace(ns, "")
+                    shader_tag = shader.tag.replace(T.ns, "")
                     if shader_tag not in ("phong","lambert","blinn","constant"):
                         continue
                     for chan in shader:
-                        chan_name = chan.tag.replace(ns, "")
-                        tex = chan.find(q(ns, "texture"))
+                        chan_name = chan.tag.replace(T.ns, "")
+                        tex = chan.find(T.texture)
                         if tex is not None:
                             path = resolve(tex.attrib.get("texture", ""))
                             if path:
@@ -167,13 +331,13 @@ def extract_material_texture_map(root, ns):
                                     channels["specular"] = path
                         # Read shininess float
                         if chan_name == "shininess":
-                            fval = chan.find(q(ns, "float"))
+                            fval = chan.find(T.float)
                             if fval is not None and fval.text:
                                 try: shininess = float(fval.text.strip())
                                 except: pass
                         # Read specular color if no specular texture
                         if chan_name == "specular" and tex is None:
-                            cval = chan.find(q(ns, "color"))
+                            cval = chan.find(T.color)
                             if cval is not None and cval.text:
                                 try:
                                     rgba = [float(x) for x in cval.text.strip().split()]
@@ -189,7 +353,7 @@ def extract_material_texture_map(root, ns):
         # --- Extra technique blocks: FCOLLADA and OpenCOLLADA3dsMax ---
         # Both store bump/normal maps here with no namespace prefix on tags.
         # We search the whole effect tree for any <technique> with known profiles.
-        for tech in eff.findall(f".//{q(ns,'technique')}") + eff.findall(".//technique"):
+        for tech in eff.findall(f".//{T.technique}") + eff.findall(".//technique"):
             profile_name = tech.attrib.get("profile", "")
             if profile_name in ("FCOLLADA", "OpenCOLLADA3dsMax", "MAX3D"):
                 # <bump> -> normal map
@@ -210,7 +374,7 @@ def extract_material_texture_map(root, ns):
                             channels.setdefault("specular", path)
 
         # --- Filename-hint fallback for any textures not yet categorised ---
-        all_tex_refs = [t.attrib.get("texture","") for t in eff.findall(f".//{q(ns,'texture')}")]
+        all_tex_refs = [t.attrib.get("texture","") for t in eff.findall(f".//{T.texture}")]
         all_paths    = [resolve(ref) for ref in all_tex_refs]
         all_paths    = [p for p in all_paths if p]
 
@@ -248,14 +412,14 @@ def extract_material_texture_map(root, ns):
 
     # 3. material_id -> effect_id
     material_to_effect = {}
-    for mat in root.findall(f".//{q(ns,'material')}"):
+    for mat in elements.materials:
         mat_id = mat.attrib.get("id")
         if not mat_id:
             continue
-        inst = mat.find(f"./{q(ns,'instance_effect')}")
+        inst = mat.find(f"./{T.instance_effect}")
         if inst is not None:
             eff_url = inst.attrib.get("url", "")[1:]
-            material_to_effect[mat_id] = eff_url
+            material_to_effect[sys.intern(mat_id)] = eff_url
 
     # 4. final map: mat_id -> channel dict
     mat_to_textures = {}
@@ -289,7 +453,7 @@ def build_armature(root, ns, collection, model_name="Armature", correction_mat=N
     joint_bind_world = {}   # joint_id -> world Matrix in bind pose
     joint_bsm        = {}   # geom_id  -> bind_shape_matrix
 
-    ctrl_lib = root.find(f".//{q(ns,'library_controllers')}")
+    ctrl_lib = root.find(q(ns, "library_controllers"))
     if ctrl_lib is not None:
         for ctrl in ctrl_lib.findall(q(ns, "controller")):
             skin = ctrl.find(q(ns, "skin"))
@@ -319,20 +483,21 @@ def build_armature(root, ns, collection, model_name="Armature", correction_mat=N
                 na  = src.find(q(ns, "Name_array"))
                 fa  = src.find(q(ns, "float_array"))
                 if na is not None and na.text:   sources[sid] = na.text.strip().split()
-                elif fa is not None and fa.text: sources[sid] = [float(x) for x in fa.text.strip().split()]
+                elif fa is not None and fa.text:
+                    floats = parse_number_text(fa.text, np.float64)
+                    if floats is not None:
+                        sources[sid] = floats
 
             jnames     = sources.get(jnames_src, [])
-            ibm_floats = sources.get(ibm_src, [])
+            ibm_floats = sources.get(ibm_src, np.empty(0))
+            # One (4, 4) row-major block per joint
+            ibms       = ibm_floats[:(len(ibm_floats) // 16) * 16].reshape(-1, 4, 4)
             for i, jname in enumerate(jnames):
                 if jname in joint_bind_world:
                     continue  # already have it from another controller
-                start = i * 16
-                if start + 16 > len(ibm_floats):
+                if i >= len(ibms):
                     continue
-                inv_bind = Matrix([ ibm_floats[start:start+4],
-                                    ibm_floats[start+4:start+8],
-                                    ibm_floats[start+8:start+12],
-                                    ibm_floats[start+12:start+16] ])
+                inv_bind = Matrix(ibms[i].tolist())
                 # bind_world = inverse of inv_bind = bone's world transform at bind pose
                 try:
                     joint_bind_world[jname] = inv_bind.inverted()
@@ -427,11 +592,12 @@ def parse_controllers(root, ns):
       controller_id -> {
         skin_source: str,
         joint_names: [str],
-        vertex_weights: {vert_idx: [(joint_idx, weight)]},
+        vertex_weights: (vert_idx, joint_idx, weight) arrays, one entry per
+                        influence with a valid joint and weight > 0,
       }
     """
     result   = {}
-    ctrl_lib = root.find(f".//{q(ns,'library_controllers')}")
+    ctrl_lib = root.find(q(ns, "library_controllers"))
     if ctrl_lib is None:
         return result
 
@@ -457,10 +623,8 @@ def parse_controllers(root, ns):
                 continue
             float_arr = src.find(q(ns, "float_array"))
             if float_arr is not None and float_arr.text:
-                try:
-                    sources[src_id] = [float(v) for v in float_arr.text.strip().split()]
-                except ValueError:
-                    sources[src_id] = []
+                floats = parse_number_text(float_arr.text, np.float32)
+                sources[src_id] = floats if floats is not None else np.empty(0, dtype=np.float32)
 
         # <joints>: find joint-names source and inv-bind-matrix source
         joints_elem     = skin.find(q(ns, "joints"))
@@ -474,7 +638,8 @@ def parse_controllers(root, ns):
 
         # <vertex_weights>
         vw             = skin.find(q(ns, "vertex_weights"))
-        vertex_weights = {}
+        vertex_weights = (np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32),
+                          np.empty(0, dtype=np.float32))
         if vw is not None:
             joint_offset  = 0
             weight_offset = 1
@@ -489,24 +654,36 @@ def parse_controllers(root, ns):
                     weight_offset = off
                     weight_src_id = src
 
-            weight_values = sources.get(weight_src_id, []) if weight_src_id else []
+            weight_values = np.asarray(sources.get(weight_src_id, []) if weight_src_id else [],
+                                       dtype=np.float32)
             vcount_elem   = vw.find(q(ns, "vcount"))
             v_elem        = vw.find(q(ns, "v"))
 
-            if vcount_elem is not None and v_elem is not None and vcount_elem.text and v_elem.text:
-                vcounts    = [int(x) for x in vcount_elem.text.strip().split()]
-                v_data     = [int(x) for x in v_elem.text.strip().split()]
+            vcounts = v_data = None
+            if vcount_elem is not None and v_elem is not None:
+                vcounts = parse_number_text(vcount_elem.text, np.int32)
+                v_data  = parse_number_text(v_elem.text, np.int32)
+
+            # Malformed index text parses to None; leave the skin without weights
+            if vcounts is not None and v_data is not None and len(vcounts) and len(v_data):
                 num_inputs = max(joint_offset, weight_offset) + 1
-                cursor     = 0
-                for vert_idx, count in enumerate(vcounts):
-                    pairs = []
-                    for _ in range(count):
-                        j_idx = v_data[cursor + joint_offset]
-                        w_idx = v_data[cursor + weight_offset]
-                        w_val = weight_values[w_idx] if 0 <= w_idx < len(weight_values) else 0.0
-                        pairs.append((j_idx, w_val))
-                        cursor += num_inputs
-                    vertex_weights[vert_idx] = pairs
+
+                # One row per (joint, weight) influence; vcount says how many belong to each vertex
+                n_pairs  = min(int(vcounts.sum()), v_data.size // num_inputs)
+                pairs    = v_data[:n_pairs * num_inputs].reshape(n_pairs, num_inputs)
+                vert_idx = np.repeat(np.arange(len(vcounts), dtype=np.int32), vcounts)[:n_pairs]
+                j_idx    = pairs[:, joint_offset]
+                w_idx    = pairs[:, weight_offset]
+
+                # Out-of-range weight indices read as 0.0, then drop bad joints / zero weights
+                invalid = (w_idx < 0) | (w_idx >= len(weight_values))
+                if len(weight_values):
+                    w_val = weight_values[np.where(invalid, 0, w_idx)]
+                    w_val[invalid] = 0.0
+                else:
+                    w_val = np.zeros(n_pairs, dtype=np.float32)
+                keep = (j_idx >= 0) & (j_idx < len(joint_names)) & (w_val > 0.0)
+                vertex_weights = (vert_idx[keep], j_idx[keep], w_val[keep])
 
         result[ctrl_id] = {
             "skin_source":        skin_source,
@@ -540,14 +717,14 @@ def build_ctrl_mat_map(root, ns, controllers):
 
 # ---------------------- GEOMETRY IMPORTER ----------------------
 
-def build_mesh_from_geometry(geom_elem, ns, collection, material_texture_map,
+def build_mesh_from_geometry(geom_elem, T, collection, material_texture_map,
                               arm_obj, controllers, ctrl_mat_override, dae_filepath,
                               armature_node_mat=None):
     """
     Convert <geometry> -> Blender mesh with positions, normals, colors, UVs,
     materials, textures, and optionally skin weights linked to arm_obj.
     """
-    mesh_elem = geom_elem.find(q(ns, "mesh"))
+    mesh_elem = geom_elem.find(T.mesh)
     if mesh_elem is None:
         print("Skipping geometry (no <mesh>):", geom_elem.attrib.get("id"))
         return None
@@ -557,21 +734,22 @@ def build_mesh_from_geometry(geom_elem, ns, collection, material_texture_map,
 
     # --- Parse <source> blocks ---
     sources = {}
-    for src in mesh_elem.findall(q(ns, "source")):
+    for src in mesh_elem.findall(T.source):
         src_id = src.attrib.get("id")
         if not src_id:
             continue
-        sources[src_id] = parse_source_float_array(src, ns)
+        sources[sys.intern(src_id)] = parse_source_float_array(src, T)
 
     # --- Parse <vertices> mapping ---
     vertices_map = {}
-    for verts in mesh_elem.findall(q(ns, "vertices")):
+    for verts in mesh_elem.findall(T.vertices):
         v_id = verts.attrib.get("id")
         if not v_id:
             continue
-        for inp in verts.findall(q(ns, "input")):
+        v_id = sys.intern(v_id)
+        for inp in verts.findall(T.input):
             if inp.attrib.get("semantic") == "POSITION":
-                vertices_map[v_id] = inp.attrib.get("source", "")[1:]
+                vertices_map[v_id] = sys.intern(inp.attrib.get("source", "")[1:])
 
     # --- Accumulators ---
     positions    = None
@@ -581,122 +759,140 @@ def build_mesh_from_geometry(geom_elem, ns, collection, material_texture_map,
     corner_cols  = []
     corner_norms = []
 
+    # Blocks usually share the same inputs; resolve + prepare their sources once.
+    # (vertex_ref, normal_id, uv_id, color_id) -> (pos_source_id, positions, normals, uvs, colors)
+    resolved_inputs = {}
+
+    def _resolve_inputs(key):
+        vertex_ref, normal_id, uv_id, color_id = key
+        pos_source_id = vertices_map.get(vertex_ref)
+        pos_rows  = sources.get(pos_source_id)
+        norm_rows = sources.get(normal_id)
+        uv_rows   = sources.get(uv_id)
+        col_rows  = sources.get(color_id)
+        norm_rows = norm_rows[:, :3] if norm_rows is not None and len(norm_rows) else None
+        uv_rows   = uv_rows[:, :2]   if uv_rows   is not None and len(uv_rows)   else None
+        if col_rows is not None and len(col_rows):
+            col_rows = col_rows[:, :4]
+            if col_rows.shape[1] == 3:
+                col_rows = np.concatenate([col_rows, np.ones((len(col_rows), 1), dtype=col_rows.dtype)], axis=1)
+        else:
+            col_rows = None
+        return pos_source_id, pos_rows, norm_rows, uv_rows, col_rows
+
     # --- Process <triangles> and <polylist> blocks ---
     # Both formats use the same index layout; polylist just needs vcount to know
     # how many vertices each polygon has (we triangulate fans on the fly).
     prim_blocks = (
-        [(tri, None) for tri in mesh_elem.findall(q(ns, "triangles"))] +
-        [(pl,  pl.find(q(ns, "vcount"))) for pl in mesh_elem.findall(q(ns, "polylist"))]
+        [(tri, None) for tri in mesh_elem.findall(T.triangles)] +
+        [(pl,  pl.find(T.vcount)) for pl in mesh_elem.findall(T.polylist)]
     )
 
     for prim, vcount_elem in prim_blocks:
         count  = int(prim.attrib.get("count", "0"))
-        p_elem = prim.find(q(ns, "p"))
+        p_elem = prim.find(T.p)
         if p_elem is None or not p_elem.text:
             continue
 
         # Resolve material symbol -> actual material id
         tri_mat_symbol = prim.attrib.get("material")
         tri_mat_id     = ctrl_mat_override.get(tri_mat_symbol, tri_mat_symbol)
-
-        input_by_offset = {}
-        max_offset      = 0
-        for inp in prim.findall(q(ns, "input")):
-            sem   = inp.attrib.get("semantic")
-            src   = inp.attrib.get("source", "")[1:]
-            off   = int(inp.attrib.get("offset", "0"))
-            set_i = inp.attrib.get("set")
-            input_by_offset[off] = (sem, src, set_i)
+        if tri_mat_id is not None:
+            tri_mat_id = sys.intern(tri_mat_id)
+
+        # Read every input in one pass straight into offset/source-id locals
+        vertex_offset = normal_offset = uv_offset = color_offset = None
+        vertex_ref    = normal_id = uv_id = color_id = None
+        max_offset    = 0
+        for inp in prim.findall(T.input):
+            sem = inp.attrib.get("semantic")
+            src = sys.intern(inp.attrib.get("source", "")[1:])
+            off = int(inp.attrib.get("offset", "0"))
             max_offset = max(max_offset, off)
+            if sem == "VERTEX":
+                if vertex_offset is None:
+                    vertex_offset = off;  vertex_ref = src
+            elif sem == "NORMAL":
+                normal_offset = off;  normal_id = src
+            elif sem == "COLOR":
+                color_offset  = off;  color_id  = src
+            elif sem == "TEXCOORD":
+                if uv_id is None or inp.attrib.get("set") == "0":
+                    uv_offset = off;  uv_id = src
 
         num_inputs = max_offset + 1
 
-        vertex_offset = pos_source_id = None
-        for off, (sem, src, _) in input_by_offset.items():
-            if sem == "VERTEX":
-                vertex_offset = off
-                pos_source_id = vertices_map.get(src)
-                break
+        key = (vertex_ref, normal_id, uv_id, color_id)
+        if key not in resolved_inputs:
+            resolved_inputs[key] = _resolve_inputs(key)
+        pos_source_id, positions, normal_source, uv_source, color_source = resolved_inputs[key]
 
         if vertex_offset is None or pos_source_id is None:
             print("Missing POSITION source in:", geom_name)
             return None
 
-        positions = sources.get(pos_source_id)
-        if not positions:
+        if positions is None or len(positions) == 0:
             print("Position source missing:", pos_source_id)
             return None
 
-        normal_offset = uv_offset = color_offset = None
-        normal_source = uv_source = color_source = None
-        for off, (sem, src, set_idx) in input_by_offset.items():
-            if sem == "NORMAL":
-                normal_offset = off;  normal_source = sources.get(src)
-            elif sem == "COLOR":
-                color_offset  = off;  color_source  = sources.get(src)
-            elif sem == "TEXCOORD":
-                if uv_source is None or set_idx == "0":
-                    uv_offset = off;  uv_source = sources.get(src)
-
-        raw_idx = [int(x) for x in p_elem.text.strip().split()]
+        raw_idx = parse_number_text(p_elem.text, np.int32)
+        if raw_idx is None:
+            print("Malformed <p> index list in:", geom_name)
+            continue
 
         # Build per-polygon vertex counts
         # <triangles>: every polygon is exactly 3 verts
         # <polylist>:  read from <vcount>
         if vcount_elem is not None and vcount_elem.text:
-            vcounts = [int(x) for x in vcount_elem.text.strip().split()]
+            vcounts = parse_number_text(vcount_elem.text, np.int32)
+            if vcounts is None:
+                print("Malformed <vcount> in:", geom_name)
+                continue
         else:
-            vcounts = [3] * count
-
-        # Walk the flat index stream polygon by polygon
-        cursor = 0
-        for poly_vcount in vcounts:
-            # Collect all corners of this polygon
-            poly_vi   = []
-            poly_uv   = []
-            poly_col  = []
-            poly_norm = []
-
-            for v in range(poly_vcount):
-                b  = cursor + v * num_inputs
-                vi = raw_idx[b + vertex_offset]
-                poly_vi.append(vi)
-
-                if normal_offset is not None and normal_source:
-                    ni = raw_idx[b + normal_offset]
-                    poly_norm.append(Vector(normal_source[ni]) if 0 <= ni < len(normal_source) else Vector((0, 0, 1)))
-
-                if color_offset is not None and color_source:
-                    ci = raw_idx[b + color_offset]
-                    if 0 <= ci < len(color_source):
-                        c = color_source[ci]
-                        poly_col.append((c[0], c[1], c[2], c[3] if len(c) == 4 else 1.0))
-                    else:
-                        poly_col.append((1, 1, 1, 1))
-
-                if uv_offset is not None and uv_source:
-                    ti = raw_idx[b + uv_offset]
-                    uv = uv_source[ti] if 0 <= ti < len(uv_source) else (0, 0)
-                    poly_uv.append((uv[0], uv[1]))
-
-            cursor += poly_vcount * num_inputs
-
-            # Triangulate as a fan from vertex 0: (0,1,2), (0,2,3), (0,3,4) ...
-            for i in range(1, poly_vcount - 1):
-                tri_vi = [poly_vi[0],   poly_vi[i],   poly_vi[i+1]]
-                if len(set(tri_vi)) < 3:
-                    continue
-                faces.append(tuple(tri_vi))
-                face_mat_ids.append(tri_mat_id)
+            vcounts = np.full(count, 3, dtype=np.int32)
+
+        # Gather the fan triangles' corner indices for the inputs we use in one go:
+        # shape (tris, 3, 4) ordered vertex, normal, uv, color
+        n_corners   = raw_idx.size // num_inputs
+        tri_corners = fan_triangulate(vcounts)
+        tri_corners = tri_corners[tri_corners[:, 2] < n_corners]   # drop tris past a truncated <p>
+        offsets     = np.array([-1 if o is None else o
+                                for o in (vertex_offset, normal_offset, uv_offset, color_offset)],
+                               dtype=np.int32)
+        tri_idx     = split_tri_indices(raw_idx, tri_corners, num_inputs, offsets)
+
+        # Drop degenerate triangles (repeated vertex index) and triangles that
+        # reference missing vertices, which the direct buffer write can't reject
+        face_vi = tri_idx[..., 0]
+        good    = ((face_vi[:, 0] != face_vi[:, 1]) &
+                   (face_vi[:, 1] != face_vi[:, 2]) &
+                   (face_vi[:, 0] != face_vi[:, 2]) &
+                   ((face_vi >= 0) & (face_vi < len(positions))).all(axis=1))
+        tri_idx = tri_idx[good]
+        if len(tri_idx) == 0:
+            continue
+
+        faces.append(face_vi[good])
+        face_mat_ids.extend([tri_mat_id] * len(tri_idx))
+
+        if normal_offset is not None and normal_source is not None:
+            ni = tri_idx[..., 1].reshape(-1)
+            corner_norms.append(gather_rows(normal_source, ni, (0, 0, 1)))
+
+        if color_offset is not None and color_source is not None:
+            ci = tri_idx[..., 3].reshape(-1)
+            corner_cols.append(gather_rows(color_source, ci, (1, 1, 1, 1)))
 
-                if poly_norm:
-                    corner_norms.extend([poly_norm[0], poly_norm[i], poly_norm[i+1]])
-                if poly_col:
-                    corner_cols.extend([poly_col[0], poly_col[i], poly_col[i+1]])
-                if poly_uv:
-                    corner_uvs.extend([poly_uv[0], poly_uv[i], poly_uv[i+1]])
+        if uv_offset is not None and uv_source is not None:
+            ti = tri_idx[..., 2].reshape(-1)
+            corner_uvs.append(gather_rows(uv_source, ti, (0, 0)))
 
-    if not positions or not faces:
+    faces        = np.concatenate(faces)        if faces        else np.empty((0, 3), dtype=np.int32)
+    corner_norms = np.concatenate(corner_norms) if corner_norms else None
+    corner_cols  = np.concatenate(corner_cols)  if corner_cols  else None
+    corner_uvs   = np.concatenate(corner_uvs)   if corner_uvs   else None
+
+    if positions is None or len(positions) == 0 or len(faces) == 0:
         print("No valid geometry in:", geom_name)
         return None
 
@@ -708,13 +904,25 @@ def build_mesh_from_geometry(geom_elem, ns, collection, material_texture_map,
     if skin_ctrl is not None:
         bsm = skin_ctrl.get("bind_shape_matrix", Matrix.Identity(4))
         if bsm != Matrix.Identity(4):
-            bsm3 = bsm.to_3x3()
-            bsm_t = bsm.to_translation()
-            positions = [tuple(bsm3 @ Vector(p) + bsm_t) for p in positions]
+            # Row-vector form of bsm3 @ p + t over the whole (V, 3) block, no per-vertex Vector
+            bsm_np    = np.array(bsm, dtype=np.float64)
+            positions = (positions @ bsm_np[:3, :3].T + bsm_np[:3, 3]).astype(np.float32)
 
+    # Fill vertex/loop/polygon buffers directly instead of going through from_pydata.
+    # loop_total is derived from loop_start (read-only since Blender 4.0).
+    n_faces = len(faces)
     mesh = bpy.data.meshes.new(geom_name)
-    mesh.from_pydata([Vector(p) for p in positions], [], faces)
+    mesh.vertices.add(len(positions))
+    mesh.loops.add(n_faces * 3)
+    mesh.polygons.add(n_faces)
+    mesh.vertices.foreach_set("co", positions.astype(np.float32).ravel())
+    mesh.loops.foreach_set("vertex_index", faces.astype(np.int32).ravel())
+    mesh.polygons.foreach_set("loop_start", np.arange(0, n_faces * 3, 3, dtype=np.int32))
+    # Edges are built once, after loops and polygons are fully populated
     mesh.update(calc_edges=True)
+    if bpy.app.debug:
+        # Expensive full check; only worth it when chasing a broken import
+        mesh.validate(verbose=True)
 
     obj = bpy.data.objects.new(geom_name, mesh)
     collection.objects.link(obj)
@@ -843,7 +1051,7 @@ def build_mesh_from_geometry(geom_elem, ns, collection, material_texture_map,
     has_second_uv = any(
         inp.attrib.get("semantic") == "TEXCOORD" and inp.attrib.get("set","0") == "1"
         for prim in mesh_elem
-        for inp in prim.findall(q(ns, "input"))
+        for inp in prim.findall(T.input)
     )
 
     unique_mat_ids = sorted({m for m in face_mat_ids if m is not None})
@@ -873,40 +1081,37 @@ def build_mesh_from_geometry(geom_elem, ns, collection, material_texture_map,
         obj.data.materials.append(mat)
         mat_index_map[mat_id] = idx
 
-    for poly, mat_id in zip(mesh.polygons, face_mat_ids):
-        if mat_id and mat_id in mat_index_map:
-            poly.material_index = mat_index_map[mat_id]
+    if mat_index_map:
+        mat_idx_per_face = np.fromiter((mat_index_map.get(m, 0) for m in face_mat_ids),
+                                       dtype=np.int32, count=len(face_mat_ids))
+        mesh.polygons.foreach_set("material_index", mat_idx_per_face)
 
     # ---------------------- UVs ----------------------
-    if corner_uvs and len(corner_uvs) == len(mesh.loops):
+    if corner_uvs is not None and len(corner_uvs) == len(mesh.loops):
         uv_layer = mesh.uv_layers.new(name="UVMap")
-        for li, uv in enumerate(corner_uvs):
-            uv_layer.data[li].uv = uv
+        uv_layer.data.foreach_set("uv", corner_uvs.astype(np.float32).ravel())
 
     # ---------------------- COLORS ----------------------
-    if corner_cols and len(corner_cols) == len(mesh.loops):
+    if corner_cols is not None and len(corner_cols) == len(mesh.loops):
         col_attr = mesh.color_attributes.new(name="Col", type="FLOAT_COLOR", domain="CORNER")
-        for li, col in enumerate(corner_cols):
-            col_attr.data[li].color = col
+        col_attr.data.foreach_set("color", corner_cols.astype(np.float32).ravel())
 
     # ---------------------- NORMALS ----------------------
-    if corner_norms and len(corner_norms) == len(mesh.loops):
-        mesh.normals_split_custom_set(corner_norms)
+    if corner_norms is not None and len(corner_norms) == len(mesh.loops):
+        # Plain float triples straight from the gathered array; no per-corner Vector
+        mesh.normals_split_custom_set(corner_norms.astype(np.float32).tolist())
 
     # ---------------------- SKIN WEIGHTS ----------------------
     if arm_obj is not None and skin_ctrl is not None:
-        joint_names    = skin_ctrl["joint_names"]
-        vertex_weights = skin_ctrl["vertex_weights"]
+        joint_names                  = skin_ctrl["joint_names"]
+        vert_idx, joint_idx, weights = skin_ctrl["vertex_weights"]
 
         # Create one vertex group per joint name
         vgroups = {jname: obj.vertex_groups.new(name=jname) for jname in joint_names}
 
-        # Assign weights vertex by vertex
-        for vert_idx, pairs in vertex_weights.items():
-            for j_idx, weight in pairs:
-                if j_idx < 0 or j_idx >= len(joint_names) or weight <= 0.0:
-                    continue
-                vgroups[joint_names[j_idx]].add([vert_idx], weight, 'ADD')
+        # Assign weights influence by influence (already bounds-checked in parse_controllers)
+        for v, j, w in zip(vert_idx.tolist(), joint_idx.tolist(), weights.tolist()):
+            vgroups[joint_names[j]].add([v], w, 'ADD')
 
         # Parent mesh to armature with Armature modifier
         obj.parent = arm_obj
@@ -940,13 +1145,13 @@ class IMPORT_OT_simple_collada_full(Operator, ImportHelper):
             return {'CANCELLED'}
 
         try:
-            tree = ET.parse(self.filepath)
-            root = tree.getroot()
+            root = parse_dae(self.filepath)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to parse DAE: {e}")
             return {'CANCELLED'}
 
         ns  = get_collada_ns(root)
+        T   = collada_tags(ns)
         dae = self.filepath
 
         if context.view_layer.active_layer_collection:
@@ -954,7 +1159,12 @@ class IMPORT_OT_simple_collada_full(Operator, ImportHelper):
         else:
             collection = context.scene.collection
 
-        material_texture_map = extract_material_texture_map(root, ns)
+        elements             = collect_elements(root, T)
+        material_texture_map = extract_material_texture_map(elements, T)
+
+        # Effects are fully resolved into material_texture_map; drop their subtrees
+        for eff in elements.effects:
+            release_element(eff)
 
         # Derive a clean model name from the filename (e.g. "Link" from "Link.dae")
         model_name = os.path.splitext(os.path.basename(dae))[0]
@@ -973,7 +1183,7 @@ class IMPORT_OT_simple_collada_full(Operator, ImportHelper):
         # Per-geometry material override from instance_controller bind_material
         geom_mat_override = build_ctrl_mat_map(root, ns, controllers)
 
-        geometries = root.findall(f".//{q(ns,'geometry')}")
+        geometries = elements.geometries
         if not geometries:
             self.report({'ERROR'}, "No <geometry> found in DAE")
             return {'CANCELLED'}
@@ -983,9 +1193,10 @@ class IMPORT_OT_simple_collada_full(Operator, ImportHelper):
             geom_id      = geom.attrib.get("id", "")
             mat_override = geom_mat_override.get(geom_id, {})
             obj = build_mesh_from_geometry(
-                geom, ns, collection, material_texture_map,
+                geom, T, collection, material_texture_map,
                 arm_obj, controllers, mat_override, dae, armature_node_mat
             )
+            release_element(geom)
             if obj:
                 imported += 1
 
@@ -1003,6 +1214,22 @@ class IMPORT_OT_simple_collada_full(Operator, ImportHelper):
 
 # ---------------------- TEXTURE ASSIGN OPERATOR ----------------------
 
+def find_simple_texture_node(node_tree):
+    """
+    Return the TexImage node if node_tree is exactly the TexImage -> Principled
+    BSDF -> Material Output graph this operator builds, otherwise None.
+    """
+    by_type = {n.type: n for n in node_tree.nodes}
+    if len(node_tree.nodes) != 3 or set(by_type) != {'TEX_IMAGE', 'BSDF_PRINCIPLED', 'OUTPUT_MATERIAL'}:
+        return None
+    img_n, bsdf_n, out_n = by_type['TEX_IMAGE'], by_type['BSDF_PRINCIPLED'], by_type['OUTPUT_MATERIAL']
+    wired = {(l.from_socket, l.to_socket) for l in node_tree.links}
+    if ((img_n.outputs["Color"], bsdf_n.inputs["Base Color"]) in wired and
+            (bsdf_n.outputs["BSDF"], out_n.inputs["Surface"]) in wired):
+        return img_n
+    return None
+
+
 class OBJECT_OT_assign_textures_by_name(Operator):
     """Assign textures based on material names matching image file names"""
     bl_idname  = "object.assign_textures_by_name"
@@ -1023,11 +1250,16 @@ class OBJECT_OT_assign_textures_by_name(Operator):
             self.report({'ERROR'}, f"Not a directory: {folder}")
             return {'CANCELLED'}
 
+        # Only images whose basename matches a selected material are loaded
+        needed = {str(mat.name).strip()
+                  for obj in context.selected_objects if hasattr(obj.data, "materials")
+                  for mat in obj.data.materials if mat}
+
         exts   = {".png", ".jpg", ".jpeg", ".tga", ".bmp", ".tif", ".tiff", ".dds"}
         images = {}
         for f in os.listdir(folder):
             name, ext = os.path.splitext(f)
-            if ext.lower() in exts:
+            if ext.lower() in exts and name in needed and name not in images:
                 full = os.path.join(folder, f)
                 try:
                     img = bpy.data.images.load(full, check_existing=True)
@@ -1046,6 +1278,15 @@ class OBJECT_OT_assign_textures_by_name(Operator):
                 mat.use_nodes = True
                 nodes = mat.node_tree.nodes
                 links = mat.node_tree.links
+
+                # Graph already built by an earlier run: only swap the image
+                img_n = find_simple_texture_node(mat.node_tree)
+                if img_n is not None:
+                    if img_n.image != img:
+                        img_n.image = img
+                    assigned += 1
+                    continue
+
                 while nodes:
                     nodes.remove(nodes[0])
                 out_n  = nodes.new("ShaderNodeOutputMaterial"); out_n.location  = ( 300, 0)